@@ -7,10 +7,65 @@ import sys
 import subprocess
 import argparse
 import datetime
+import importlib.util
 import os
 
-def save_test_output(output, returncode, test_type):
-    """Save test output to a log file with timestamp."""
+import pytest
+
+# Test types whose suites are independent enough to spread across CPU cores
+PARALLEL_TEST_TYPES = {"all", "ui", "test_ui", "integration"}
+
+# Available test suites; also the source of the command-line choices
+TEST_CONFIGS = {
+    "all": {
+        "path": ("tests/",),
+        "description": "Run all tests"
+    },
+    "core": {
+        "path": ("tests/test_core/test_models.py", "tests/test_core/test_timeline.py"),
+        "description": "Run core functionality tests (models and timeline)",
+        "extra_args": ["--cov=src.core"]
+    },
+    "models": {
+        "path": ("tests/test_core/test_models.py",),
+        "description": "Run only model tests",
+        "extra_args": ["--cov=src.core.models"]
+    },
+    "ui": {
+        "path": ("tests/test_ui/test_ui_components.py", "tests/test_ui/test_navigation.py"),
+        "description": "Run UI and navigation tests"
+    },
+    "timeline": {
+        "path": ("tests/test_core/test_timeline.py",),
+        "description": "Run timeline generation tests"
+    },
+    "quick": {
+        "path": ("tests/test_core/test_models.py",),
+        "description": "Quick test run (models only)",
+        "extra_args": ["--tb=line", "-q", "--no-cov"]
+    },
+    "test_core": {
+        "path": ("tests/test_core/",),
+        "description": "Run all core module tests",
+        "extra_args": ["--cov=src.core"]
+    },
+    "test_ui": {
+        "path": ("tests/test_ui/",),
+        "description": "Run all UI module tests"
+    },
+    "unit": {
+        "path": ("tests/test_core/",),
+        "description": "Run unit tests (business logic only)",
+        "extra_args": ["--cov=src.core"]
+    },
+    "integration": {
+        "path": ("tests/test_ui/",),
+        "description": "Run integration tests (UI interactions)"
+    }
+}
+
+def save_test_output(cmd, test_type):
+    """Run the command, streaming its output to the console and a timestamped log file."""
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     log_filename = f"test_log_{timestamp}_{test_type}.txt"
     
@@ -26,93 +81,59 @@ def save_test_output(output, returncode, test_type):
         f.write(f"{'=' * 50}\n")
         f.write(f"Timestamp: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         f.write(f"Test Type: {test_type}\n")
-        f.write(f"Exit Code: {returncode}\n")
         f.write(f"{'=' * 50}\n\n")
-        f.write(output)
+        
+        # Merge stderr into stdout and copy line by line so memory stays flat
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+        )
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            f.write(line)
+        returncode = proc.wait()
+        
+        f.write(f"\n{'=' * 50}\n")
+        f.write(f"Exit Code: {returncode}\n")
     
     print(f"Test output saved to: {log_path}")
-    return log_path
+    return returncode
 
 def run_tests(test_type="all", verbose=True, save_log=False):
     """Run tests based on the specified type."""
-    base_cmd = ["python", "-m", "pytest"]
+    pytest_args = []
     
     if verbose:
-        base_cmd.append("-v")
+        pytest_args.append("-v")
     
-    test_configs = {
-        "all": {
-            "path": "tests/",
-            "description": "Run all tests"
-        },
-        "core": {
-            "path": "tests/test_core/test_models.py tests/test_core/test_timeline.py",
-            "description": "Run core functionality tests (models and timeline)",
-            "extra_args": ["--cov=src.core"]
-        },
-        "models": {
-            "path": "tests/test_core/test_models.py",
-            "description": "Run only model tests",
-            "extra_args": ["--cov=src.core.models"]
-        },
-        "ui": {
-            "path": "tests/test_ui/test_ui_components.py tests/test_ui/test_navigation.py",
-            "description": "Run UI and navigation tests"
-        },
-        "timeline": {
-            "path": "tests/test_core/test_timeline.py",
-            "description": "Run timeline generation tests"
-        },
-        "quick": {
-            "path": "tests/test_core/test_models.py",
-            "description": "Quick test run (models only)",
-            "extra_args": ["--tb=line", "-q"]
-        },
-        "test_core": {
-            "path": "tests/test_core/",
-            "description": "Run all core module tests",
-            "extra_args": ["--cov=src.core"]
-        },
-        "test_ui": {
-            "path": "tests/test_ui/",
-            "description": "Run all UI module tests"
-        },
-        "unit": {
-            "path": "tests/test_core/",
-            "description": "Run unit tests (business logic only)",
-            "extra_args": ["--cov=src.core"]
-        },
-        "integration": {
-            "path": "tests/test_ui/",
-            "description": "Run integration tests (UI interactions)"
-        }
-    }
-    
-    if test_type not in test_configs:
+    if test_type not in TEST_CONFIGS:
         print(f"Unknown test type: {test_type}")
-        print(f"Available types: {', '.join(test_configs.keys())}")
+        print(f"Available types: {', '.join(TEST_CONFIGS)}")
         return 1
     
-    config = test_configs[test_type]
-    cmd = base_cmd + config["path"].split()
+    config = TEST_CONFIGS[test_type]
+    pytest_args.extend(config["path"])
     
     if "extra_args" in config:
-        cmd.extend(config["extra_args"])
+        pytest_args.extend(config["extra_args"])
+    
+    # Run in parallel when pytest-xdist is installed
+    if test_type in PARALLEL_TEST_TYPES and importlib.util.find_spec("xdist"):
+        pytest_args.extend(["-n", "auto", "--dist=loadfile"])
     
     print(f"Running: {config['description']}")
-    print(f"Command: {' '.join(cmd)}")
-    print("-" * 50)
     
     try:
         if save_log:
-            # Capture output when logging is enabled
-            result = subprocess.run(cmd, check=False, capture_output=True, text=True)
-            output = f"STDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}"
-            save_test_output(output, result.returncode, test_type)
-        else:
-            result = subprocess.run(cmd, check=False)
+            cmd = [sys.executable, "-m", "pytest"] + pytest_args
+            print(f"Command: {' '.join(cmd)}")
+            print("-" * 50)
+            # Stream output to the console and the log file as it arrives
+            return save_test_output(cmd, test_type)
         
-        return result.returncode
+        # Run pytest in-process to skip a second interpreter startup
+        print(f"Command: pytest.main({pytest_args!r})")
+        print("-" * 50)
+        return int(pytest.main(pytest_args))
     except KeyboardInterrupt:
         print("\nTest run interrupted by user")
         return 130
@@ -123,7 +144,7 @@ def main():
         "test_type", 
         nargs="?", 
         default="core",
-        choices=["all", "core", "models", "ui", "timeline", "quick", "test_core", "test_ui", "unit", "integration"],
+        choices=tuple(TEST_CONFIGS),
         help="Type of tests to run (default: core)"
     )
     parser.add_argument(
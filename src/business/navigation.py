@@ -1,14 +1,14 @@
 """
 Navigation business logic - manages screen state without UI dependencies.
 """
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 
 
 class ScreenNavigator:
     """Manages screen navigation state and validation."""
     
     # Valid screen names in the application
-    VALID_SCREENS = {
+    VALID_SCREENS: FrozenSet[str] = frozenset({
         'main_menu',
         'executive_function', 
         'emotions_management',
@@ -19,7 +19,7 @@ class ScreenNavigator:
         'todo_list',
         'times_dependencies',
         'timeline_view'
-    }
+    })
     
     def __init__(self):
         self.current_screen = 'main_menu'
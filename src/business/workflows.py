@@ -1,7 +1,7 @@
 """
 Business workflow logic - manages todo workflows without UI dependencies.
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Any
 from dataclasses import dataclass
 from src.core.models import Task, TaskManager
 
@@ -20,49 +20,51 @@ class TodoWorkflow:
     
     def __init__(self):
         self.task_manager = TaskManager()
-        self._task_id_counter = 1
-        self._task_id_map: Dict[int, Task] = {}
+        # Task IDs are list indices; slot 0 is unused so IDs stay 1-based
+        self._tasks_by_id: List[Optional[Task]] = [None]
         
     def add_task(self, title: str, description: str = "", estimated_time: int = 0) -> int:
         """Add a task and return its ID."""
         task = Task(title, description, estimated_time)
         self.task_manager.add_task(task)
         
-        # Create a simple ID mapping
-        task_id = self._task_id_counter
-        self._task_id_map[task_id] = task
-        self._task_id_counter += 1
-        
-        return task_id
+        self._tasks_by_id.append(task)
+        return len(self._tasks_by_id) - 1
         
     def get_task(self, task_id: int) -> Optional[Task]:
         """Get a task by ID."""
-        return self._task_id_map.get(task_id)
+        # IDs index a list, so anything but a real int (None, str, bool) is unknown
+        if type(task_id) is int and 0 < task_id < len(self._tasks_by_id):
+            return self._tasks_by_id[task_id]
+        return None
         
     def get_all_tasks(self) -> List[Task]:
         """Get all tasks."""
-        return self.task_manager.tasks.copy()
+        return list(self.task_manager.tasks)
         
     def set_dependency(self, task_id: int, depends_on: int) -> bool:
         """Set task dependency. Returns True if successful."""
-        task = self._task_id_map.get(task_id)
-        dependency = self._task_id_map.get(depends_on)
+        task = self.get_task(task_id)
+        dependency = self.get_task(depends_on)
         
         if task and dependency:
-            task.add_dependency(dependency)
+            try:
+                task.add_dependency(dependency)
+            except ValueError:
+                return False
             return True
         return False
         
     def start_task(self, task_id: int) -> bool:
         """Start a task. Returns True if successful."""
-        task = self._task_id_map.get(task_id)
+        task = self.get_task(task_id)
         if task:
             return self.task_manager.start_task(task)
         return False
         
     def complete_task(self, task_id: int) -> bool:
         """Complete a specific task. Returns True if successful."""
-        task = self._task_id_map.get(task_id)
+        task = self.get_task(task_id)
         if task:
             task.mark_completed()
             return True
@@ -81,19 +83,23 @@ class TodoWorkflow:
         
     def generate_timeline(self) -> TimelineData:
         """Generate timeline data for visualization."""
-        ready_tasks = self.task_manager.get_ready_tasks()
-        all_tasks = self.task_manager.tasks
-        completed_tasks = self.task_manager.get_completed_tasks()
+        current_task = self.task_manager.current_task
+        ready_tasks: List[Task] = []
+        blocked_tasks: List[Task] = []
+        completed_tasks: List[Task] = []
         
-        # Find blocked tasks (not ready and not completed)
-        blocked_tasks = [
-            task for task in all_tasks 
-            if not task.can_start() and not task.completed
-        ]
+        # Partition all tasks in a single pass
+        for task in self.task_manager.tasks:
+            if task.completed:
+                completed_tasks.append(task)
+            elif not task.can_start():
+                blocked_tasks.append(task)
+            elif task is not current_task:
+                ready_tasks.append(task)
         
         return TimelineData(
             ready_tasks=ready_tasks,
             blocked_tasks=blocked_tasks,
             completed_tasks=completed_tasks,
-            current_task=self.task_manager.current_task
+            current_task=current_task
         )
\ No newline at end of file
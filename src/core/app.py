@@ -1,12 +1,12 @@
 from kivy.app import App
+from kivy.clock import Clock
 from kivy.uix.screenmanager import ScreenManager
-from kivy.properties import ListProperty
 from src.core.config import AppConfig
-from src.ui.color_palette import ColorPalette
 from src.ui.screens import (
     MainMenuScreen, ExecutiveFunctionScreen, ToDoTimelineScreen,
     ToDoListScreen, TimesDependenciesScreen, TimelineViewScreen,
-    EmotionsManagementScreen, HabitsScreen, PomodoroScreen, RoutinesScreen
+    EmotionsManagementScreen, HabitsScreen, PomodoroScreen, RoutinesScreen,
+    set_screen_background
 )
 
 
@@ -14,37 +14,46 @@ class AppScreenManager(ScreenManager):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         
-        # Add all screens
-        self.add_widget(MainMenuScreen())
-        self.add_widget(ExecutiveFunctionScreen())
-        self.add_widget(ToDoTimelineScreen())
-        self.add_widget(ToDoListScreen())
-        self.add_widget(TimesDependenciesScreen())
-        self.add_widget(TimelineViewScreen())
-        self.add_widget(EmotionsManagementScreen())
-        self.add_widget(HabitsScreen())
-        self.add_widget(PomodoroScreen())
-        self.add_widget(RoutinesScreen())
+        # One background behind every screen instead of one per screen
+        set_screen_background(self)
+        
+        # Screens are created on first visit or by the preload below, whichever comes first
+        self._screen_factories = {
+            'main_menu': MainMenuScreen,
+            'executive_function': ExecutiveFunctionScreen,
+            'todo_timeline': ToDoTimelineScreen,
+            'todo_list': ToDoListScreen,
+            'times_dependencies': TimesDependenciesScreen,
+            'timeline_view': TimelineViewScreen,
+            'emotions_management': EmotionsManagementScreen,
+            'habits': HabitsScreen,
+            'pomodoro': PomodoroScreen,
+            'routines': RoutinesScreen,
+        }
         
         # Set initial screen
-        self.current = 'main_menu'
+        self.switch_to_screen('main_menu')
+        
+        # Build and add the other screens one per frame after the first paint
+        self._preload_names = iter(self._screen_factories)
+        Clock.schedule_once(self._preload_next_screen, 0)
     
     def switch_to_screen(self, screen_name):
+        if not self.has_screen(screen_name):
+            self.add_widget(self._screen_factories[screen_name]())
         self.current = screen_name
+    
+    def _preload_next_screen(self, dt):
+        for screen_name in self._preload_names:
+            if not self.has_screen(screen_name):
+                screen = self._screen_factories[screen_name]()
+                screen.ensure_built()
+                self.add_widget(screen)
+                Clock.schedule_once(self._preload_next_screen, 0)
+                return
 
 
 class PersonalAssistantApp(App):
-    # Color properties that can be accessed in .kv files as app.text_primary_color, etc.
-    text_primary_color = ListProperty(ColorPalette.TEXT_PRIMARY)
-    text_secondary_color = ListProperty(ColorPalette.TEXT_SECONDARY)
-    button_primary_color = ListProperty(ColorPalette.BUTTON_PRIMARY)
-    button_secondary_color = ListProperty(ColorPalette.BUTTON_SECONDARY)
-    button_tertiary_color = ListProperty(ColorPalette.BUTTON_TERTIARY)
-    button_neutral_color = ListProperty(ColorPalette.BUTTON_NEUTRAL)
-    background_primary_color = ListProperty(ColorPalette.BACKGROUND_PRIMARY)
-    background_secondary_color = ListProperty(ColorPalette.BACKGROUND_SECONDARY)
-    accent_blue_color = ListProperty(ColorPalette.ACCENT_BLUE)
-    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.title = AppConfig.get_app_title()
@@ -1,66 +1,209 @@
+import heapq
+import itertools
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Set, ValuesView
+
+# Dense, process-unique task IDs
+_next_id = itertools.count(1)
 
 
 class Task:
+    __slots__ = (
+        'id', 'title', 'description', 'estimated_time', 'dependencies',
+        'created_at', '_completed', 'start_time', 'end_time',
+        '_pending_deps', '_dependents', '_manager', '__weakref__',
+    )
+    
     def __init__(self, title: str, description: str = "", estimated_time: int = 0):
-        self.id = id(self)  # Simple ID generation
+        self.id = next(_next_id)
         self.title = title
         self.description = description
         self.estimated_time = estimated_time  # in minutes
-        self.dependencies: List['Task'] = []
+        self.dependencies: Set['Task'] = set()
         self.created_at = datetime.now()
-        self.completed = False
+        self._completed = False
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
+        # Readiness bookkeeping: unfinished dependency count and reverse edges
+        self._pending_deps = 0
+        self._dependents: Set['Task'] = set()
+        # Manager whose ready set tracks this task (a task belongs to one manager)
+        self._manager: Optional['TaskManager'] = None
     
     def add_dependency(self, task: 'Task'):
-        if task not in self.dependencies:
-            self.dependencies.append(task)
+        if task in self.dependencies:
+            return
+        if task is self or self._has_dependent(task):
+            raise ValueError(f"Dependency on '{task.title}' would create a cycle")
+        self.dependencies.add(task)
+        task._dependents.add(self)
+        if not task.completed:
+            self._pending_deps += 1
+        self._dependencies_changed()
     
     def remove_dependency(self, task: 'Task'):
-        if task in self.dependencies:
-            self.dependencies.remove(task)
+        if task not in self.dependencies:
+            return
+        self.dependencies.discard(task)
+        task._dependents.discard(self)
+        if not task.completed:
+            self._pending_deps -= 1
+        self._dependencies_changed()
+    
+    @property
+    def completed(self) -> bool:
+        # Read-only so readiness counters only change through mark_completed()
+        return self._completed
     
     def can_start(self) -> bool:
-        return all(dep.completed for dep in self.dependencies)
+        return self._pending_deps == 0
     
     def mark_completed(self):
-        self.completed = True
+        was_completed = self._completed
+        self._completed = True
         self.end_time = datetime.now()
+        if not was_completed:
+            if self._manager is not None:
+                self._manager._task_completed(self)
+            for dependent in self._dependents:
+                dependent._pending_deps -= 1
+                dependent._refresh_readiness()
     
     def start_task(self):
         if self.can_start() and not self.completed:
             self.start_time = datetime.now()
     
+    def _has_dependent(self, task: 'Task') -> bool:
+        seen = {self}
+        stack = [self]
+        while stack:
+            for dependent in stack.pop()._dependents:
+                if dependent is task:
+                    return True
+                if dependent not in seen:
+                    seen.add(dependent)
+                    stack.append(dependent)
+        return False
+    
+    def _refresh_readiness(self):
+        if self._manager is not None:
+            self._manager._update_ready(self)
+    
+    def _dependencies_changed(self):
+        if self._manager is not None:
+            self._manager._dependencies_changed(self)
+    
     def __str__(self):
         return f"Task: {self.title}"
 
 
 class TaskManager:
+    __slots__ = (
+        '_tasks', 'current_task', '_ready', '_order', '_next_order', '_topo_order',
+        '_completed_count', '__weakref__',
+    )
+    
     def __init__(self):
-        self.tasks: List[Task] = []
+        self._tasks: Dict[int, Task] = {}
         self.current_task: Optional[Task] = None
+        # Live set of startable, unfinished tasks, kept up to date by Task
+        self._ready: Set[Task] = set()
+        self._order: Dict[Task, int] = {}
+        self._next_order = 0
+        # Cached dependency order, rebuilt lazily after structural changes
+        self._topo_order: Optional[List[Task]] = None
+        self._completed_count = 0
+    
+    @property
+    def tasks(self) -> ValuesView[Task]:
+        # Live read-only view in insertion order; use add_task/remove_task to change it
+        return self._tasks.values()
     
     def add_task(self, task: Task):
-        self.tasks.append(task)
+        if task._manager is self:
+            return
+        if task._manager is not None:
+            raise ValueError(f"Task '{task.title}' already belongs to another TaskManager")
+        self._tasks[task.id] = task
+        task._manager = self
+        self._order[task] = self._next_order
+        self._next_order += 1
+        self._topo_order = None
+        if task.completed:
+            self._completed_count += 1
+        self._update_ready(task)
     
     def remove_task(self, task: Task):
-        if task in self.tasks:
-            self.tasks.remove(task)
-            # Remove this task from other tasks' dependencies
-            for t in self.tasks:
-                t.remove_dependency(task)
+        if self._tasks.get(task.id) is task:
+            del self._tasks[task.id]
+            task._manager = None
+            self._ready.discard(task)
+            del self._order[task]
+            self._topo_order = None
+            if task.completed:
+                self._completed_count -= 1
+            # Remove this task from the dependencies of tasks that rely on it
+            for dependent in list(task._dependents):
+                if dependent._manager is self:
+                    dependent.remove_dependency(task)
+    
+    def _update_ready(self, task: Task):
+        if task.can_start() and not task.completed:
+            self._ready.add(task)
+        else:
+            self._ready.discard(task)
+    
+    def _task_completed(self, task: Task):
+        self._completed_count += 1
+        self._ready.discard(task)
+    
+    def _dependencies_changed(self, task: Task):
+        self._topo_order = None
+        self._update_ready(task)
+    
+    def _topological_order(self) -> List[Task]:
+        """Kahn's algorithm over this manager's tasks, ties broken by insertion order."""
+        if self._topo_order is None:
+            in_degree = {
+                task: sum(1 for dep in task.dependencies if dep._manager is self)
+                for task in self._tasks.values()
+            }
+            heap = [(self._order[task], task) for task, degree in in_degree.items() if degree == 0]
+            heapq.heapify(heap)
+            order = []
+            while heap:
+                _, task = heapq.heappop(heap)
+                order.append(task)
+                for dependent in task._dependents:
+                    if dependent._manager is self:
+                        in_degree[dependent] -= 1
+                        if in_degree[dependent] == 0:
+                            heapq.heappush(heap, (self._order[dependent], dependent))
+            self._topo_order = order
+        return self._topo_order
     
     def get_ready_tasks(self) -> List[Task]:
-        return [task for task in self.tasks 
-                if task.can_start() and not task.completed and task != self.current_task]
+        # Keep the order in which tasks were added
+        return [task for task in sorted(self._ready, key=self._order.__getitem__)
+                if task is not self.current_task]
+    
+    def iter_completed(self) -> Iterator[Task]:
+        return (task for task in self._tasks.values() if task.completed)
+    
+    def iter_pending(self) -> Iterator[Task]:
+        return (task for task in self._tasks.values() if not task.completed)
     
     def get_completed_tasks(self) -> List[Task]:
-        return [task for task in self.tasks if task.completed]
+        return list(self.iter_completed())
     
     def get_pending_tasks(self) -> List[Task]:
-        return [task for task in self.tasks if not task.completed]
+        return list(self.iter_pending())
+    
+    def get_completed_count(self) -> int:
+        return self._completed_count
+    
+    def get_pending_count(self) -> int:
+        return len(self._tasks) - self._completed_count
     
     def start_task(self, task: Task):
         if task.can_start():
@@ -76,18 +219,17 @@ class TaskManager:
     
     def get_timeline_data(self):
         """Generate timeline data for visualization"""
-        timeline_data = {
-            'current_task': self.current_task,
-            'ready_tasks': self.get_ready_tasks(),
-            'parallel_tasks': [],  # Tasks that can be done in parallel
-            'upcoming_tasks': []
-        }
-        
         ready_tasks = self.get_ready_tasks()
-        if len(ready_tasks) > 1:
-            timeline_data['parallel_tasks'] = ready_tasks[1:3]  # Show up to 2 parallel tasks
+        # Blocked tasks, in the order their dependencies will release them
+        upcoming_tasks = [task for task in self._topological_order()
+                          if not task.completed and not task.can_start()]
         
-        return timeline_data
+        return {
+            'current_task': self.current_task,
+            'ready_tasks': ready_tasks,
+            'parallel_tasks': ready_tasks[1:3],  # Show up to 2 parallel tasks
+            'upcoming_tasks': upcoming_tasks
+        }
 
 
 # Global task manager instance
@@ -4,6 +4,7 @@ Color Palette for Personal Assistant Application
 Centralized color definitions for consistent theming and easy customization.
 Colors are defined with semantic names and include accessibility-compliant combinations.
 """
+from typing import Dict
 
 
 class ColorPalette:
@@ -36,6 +37,12 @@ class ColorPalette:
     # Accent Colors for special elements
     ACCENT_BLUE = (0.3, 0.7, 0.9, 1)  # Brighter blue for highlights
     
+    # Name -> RGBA lookup table used by get_color, built from the constants above
+    _COLORS: Dict[str, tuple] = {
+        name: value for name, value in locals().items()
+        if name.isupper() and isinstance(value, tuple)
+    }
+    
     @classmethod
     def get_color(cls, color_name: str) -> tuple:
         """
@@ -47,4 +54,5 @@ class ColorPalette:
         Returns:
             RGBA tuple representing the color
         """
-        return getattr(cls, color_name.upper(), cls.BACKGROUND_PRIMARY)
\ No newline at end of file
+        return cls._COLORS.get(color_name.upper(), cls.BACKGROUND_PRIMARY)
+
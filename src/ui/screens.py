@@ -1,35 +1,146 @@
+import os
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.uix.gridlayout import GridLayout
+from kivy.factory import Factory
 from kivy.graphics import Color, Rectangle
+from kivy.properties import NumericProperty, StringProperty
+from kivy.lang import Builder
 from src.core.config import AppConfig
 from src.ui.color_palette import ColorPalette
 
+# Palette colors used by the screens, resolved once at import
+_BG = ColorPalette.BACKGROUND_PRIMARY
+_BTN_P = ColorPalette.BUTTON_PRIMARY
+_BTN_S = ColorPalette.BUTTON_SECONDARY
+_BTN_T = ColorPalette.BUTTON_TERTIARY
+_TXT_P = ColorPalette.TEXT_PRIMARY
+_TXT_S = ColorPalette.TEXT_SECONDARY
+
+# Widget styles shared by several screens
+_TITLE_STYLE = dict(size_hint_y=None, height=80, font_size=28, color=_TXT_P)
+_SUBTITLE_STYLE = dict(size_hint_y=None, height=30, font_size=16, color=_TXT_S)
+
+# Screens each menu screen can navigate to
+_MAIN_MENU_OPTIONS = ('executive_function', 'emotions_management', 'habits', 'pomodoro', 'routines')
+_EXECUTIVE_FUNCTION_OPTIONS = ('todo_timeline', 'pomodoro', 'routines')
+_TODO_TIMELINE_OPTIONS = ('todo_list', 'times_dependencies', 'timeline_view')
+
+# Menu buttons as (text, target screen, color)
+_MAIN_MENU_BUTTONS = (
+    ('Executive\nFunction', 'executive_function', _BTN_P),
+    ('Emotions\nManagement', 'emotions_management', _BTN_S),
+    ('Habits', 'habits', _BTN_T),
+)
+_EXECUTIVE_FUNCTION_BUTTONS = (
+    ('ToDo\nTimeline', 'todo_timeline', _BTN_P),
+    ('Pomodoro', 'pomodoro', _BTN_S),
+    ('Routines', 'routines', _BTN_T),
+)
+_TODO_TIMELINE_BUTTONS = (
+    ('To-Do List', 'todo_list', _BTN_P),
+    ('Times and\ndependencies', 'times_dependencies', _BTN_S),
+    ('Timeline', 'timeline_view', _BTN_T),
+)
+
+# KV rules for widgets repeated across screens
+Builder.load_file(os.path.join(os.path.dirname(__file__), 'screens.kv'))
+
+
+class TodoItemRow(RecycleDataViewBehavior, BoxLayout):
+    """Time and dependency inputs for one todo; the layout lives in KV."""
+    index = NumericProperty(0)
+    time = StringProperty('')
+    deps = StringProperty('')
+    _data = None
+
+    def refresh_view_attrs(self, rv, index, data):
+        # Rows are recycled, so typed text must live in the data dict, not the view
+        self._data = data
+        super().refresh_view_attrs(rv, index, data)
+
+    def on_time(self, instance, value):
+        if self._data is not None:
+            self._data['time'] = value
+
+    def on_deps(self, instance, value):
+        if self._data is not None:
+            self._data['deps'] = value
+
+
+def _sync_rect(instance, value):
+    rect = instance.rect
+    rect.pos = instance.pos
+    rect.size = instance.size
+
+
+def _nav_button(screen, text, target, color, kind='NavButton'):
+    """Build a `kind` button (a Factory class name) that takes screen's manager to target when pressed."""
+    button = Factory.get(kind)(text=text, background_color=color)
+    button.fbind('on_press', screen._goto, target)
+    return button
+
+
+class BackButton(Button):
+    """Neutral 'Back' button that takes screen to target when pressed."""
+    
+    def __init__(self, screen, target, **kwargs):
+        super().__init__(**kwargs)
+        self.fbind('on_press', screen._goto, target)
+
+
+class NavMixin:
+    """Navigation shared by all screens."""
+    
+    def _goto(self, target, *_):
+        self.manager.switch_to_screen(target)
+
+
+class LazyScreen(NavMixin, Screen):
+    """Screen whose widgets are built by _build() when it is first entered."""
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._built = False
+    
+    def on_pre_enter(self, *args):
+        self.ensure_built()
+    
+    def ensure_built(self):
+        """Build the screen's widgets unless that has already happened."""
+        if not self._built:
+            self._built = True
+            self._build()
+    
+    def _build(self):
+        """Create the screen's widgets; subclasses must override this."""
+        raise NotImplementedError
+
 
 def set_screen_background(screen, color=None):
-    """Helper function to set background color for any screen."""
+    """Helper function to set background color for any screen or screen manager."""
     if color is None:
-        color = ColorPalette.BACKGROUND_PRIMARY
+        color = _BG
     
     with screen.canvas.before:
         Color(*color)
         screen.rect = Rectangle(size=screen.size, pos=screen.pos)
-    screen.bind(size=lambda instance, value: setattr(screen.rect, 'size', instance.size))
-    screen.bind(pos=lambda instance, value: setattr(screen.rect, 'pos', instance.pos))
+    screen.fbind('size', _sync_rect)
+    screen.fbind('pos', _sync_rect)
 
 
-class MainMenuScreen(Screen):
+class MainMenuScreen(LazyScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.name = 'main_menu'
-        
-        # Set screen background color
-        set_screen_background(self)
-        
+    
+    def _build(self):
         layout = BoxLayout(orientation='vertical', padding=20, spacing=15)
         
         # Title
@@ -38,209 +149,79 @@ class MainMenuScreen(Screen):
             size_hint_y=None,
             height=80,
             font_size=32,
-            color=ColorPalette.TEXT_PRIMARY
+            color=_TXT_P
         )
         layout.add_widget(title)
         
         # Navigation buttons
-        executive_btn = Button(
-            text='Executive\nFunction',
-            size_hint_y=None,
-            height=120,
-            font_size=20,
-            background_color=ColorPalette.BUTTON_PRIMARY
-        )
-        executive_btn.bind(on_press=lambda x: self.manager.switch_to_screen('executive_function'))
-        
-        emotions_btn = Button(
-            text='Emotions\nManagement',
-            size_hint_y=None,
-            height=120,
-            font_size=20,
-            background_color=ColorPalette.BUTTON_SECONDARY
-        )
-        emotions_btn.bind(on_press=lambda x: self.manager.switch_to_screen('emotions_management'))
-        
-        habits_btn = Button(
-            text='Habits',
-            size_hint_y=None,
-            height=120,
-            font_size=20,
-            background_color=ColorPalette.BUTTON_TERTIARY
-        )
-        habits_btn.bind(on_press=lambda x: self.manager.switch_to_screen('habits'))
-        
-        layout.add_widget(executive_btn)
-        layout.add_widget(emotions_btn)
-        layout.add_widget(habits_btn)
+        for text, target, color in _MAIN_MENU_BUTTONS:
+            layout.add_widget(_nav_button(self, text, target, color))
         
         self.add_widget(layout)
         
     def get_navigation_options(self):
         """Return the navigation options available from this screen."""
-        return [
-            'executive_function',
-            'emotions_management', 
-            'habits',
-            'pomodoro',
-            'routines'
-        ]
+        return _MAIN_MENU_OPTIONS
 
 
-class ExecutiveFunctionScreen(Screen):
+class ExecutiveFunctionScreen(LazyScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.name = 'executive_function'
-        
-        # Set screen background color
-        set_screen_background(self)
-        
+    
+    def _build(self):
         layout = BoxLayout(orientation='vertical', padding=20, spacing=15)
         
         # Title
-        title = Label(
-            text='Executive\nFunction',
-            size_hint_y=None,
-            height=80,
-            font_size=28,
-            color=ColorPalette.TEXT_PRIMARY
-        )
+        title = Label(text='Executive\nFunction', **_TITLE_STYLE)
         layout.add_widget(title)
         
         # Sub-module buttons
-        todo_timeline_btn = Button(
-            text='ToDo\nTimeline',
-            size_hint_y=None,
-            height=120,
-            font_size=20,
-            background_color=ColorPalette.BUTTON_PRIMARY
-        )
-        todo_timeline_btn.bind(on_press=lambda x: self.manager.switch_to_screen('todo_timeline'))
-        
-        pomodoro_btn = Button(
-            text='Pomodoro',
-            size_hint_y=None,
-            height=120,
-            font_size=20,
-            background_color=ColorPalette.BUTTON_SECONDARY
-        )
-        pomodoro_btn.bind(on_press=lambda x: self.manager.switch_to_screen('pomodoro'))
-        
-        routines_btn = Button(
-            text='Routines',
-            size_hint_y=None,
-            height=120,
-            font_size=20,
-            background_color=ColorPalette.BUTTON_TERTIARY
-        )
-        routines_btn.bind(on_press=lambda x: self.manager.switch_to_screen('routines'))
+        for text, target, color in _EXECUTIVE_FUNCTION_BUTTONS:
+            layout.add_widget(_nav_button(self, text, target, color))
         
         # Back button
-        back_btn = Button(
-            text='Back',
-            size_hint_y=None,
-            height=50,
-            background_color=ColorPalette.BUTTON_NEUTRAL
-        )
-        back_btn.bind(on_press=lambda x: self.manager.switch_to_screen('main_menu'))
-        
-        layout.add_widget(todo_timeline_btn)
-        layout.add_widget(pomodoro_btn)
-        layout.add_widget(routines_btn)
-        layout.add_widget(back_btn)
+        layout.add_widget(BackButton(self, 'main_menu'))
         
         self.add_widget(layout)
         
     def get_navigation_options(self):
         """Return the navigation options available from this screen."""
-        return [
-            'todo_timeline',
-            'pomodoro',
-            'routines'
-        ]
+        return _EXECUTIVE_FUNCTION_OPTIONS
 
 
-class ToDoTimelineScreen(Screen):
+class ToDoTimelineScreen(LazyScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.name = 'todo_timeline'
-        
-        # Set screen background color
-        set_screen_background(self)
-        
+    
+    def _build(self):
         layout = BoxLayout(orientation='vertical', padding=20, spacing=15)
         
         # Title
-        title = Label(
-            text='ToDo\nTimeline',
-            size_hint_y=None,
-            height=80,
-            font_size=28,
-            color=ColorPalette.TEXT_PRIMARY
-        )
+        title = Label(text='ToDo\nTimeline', **_TITLE_STYLE)
         layout.add_widget(title)
         
         # Sub-options
-        todo_list_btn = Button(
-            text='To-Do List',
-            size_hint_y=None,
-            height=120,
-            font_size=20,
-            background_color=ColorPalette.BUTTON_PRIMARY
-        )
-        todo_list_btn.bind(on_press=lambda x: self.manager.switch_to_screen('todo_list'))
-        
-        times_deps_btn = Button(
-            text='Times and\ndependencies',
-            size_hint_y=None,
-            height=120,
-            font_size=20,
-            background_color=ColorPalette.BUTTON_SECONDARY
-        )
-        times_deps_btn.bind(on_press=lambda x: self.manager.switch_to_screen('times_dependencies'))
-        
-        timeline_btn = Button(
-            text='Timeline',
-            size_hint_y=None,
-            height=120,
-            font_size=20,
-            background_color=ColorPalette.BUTTON_TERTIARY
-        )
-        timeline_btn.bind(on_press=lambda x: self.manager.switch_to_screen('timeline_view'))
+        for text, target, color in _TODO_TIMELINE_BUTTONS:
+            layout.add_widget(_nav_button(self, text, target, color))
         
         # Back button
-        back_btn = Button(
-            text='Back',
-            size_hint_y=None,
-            height=50,
-            background_color=ColorPalette.BUTTON_NEUTRAL
-        )
-        back_btn.bind(on_press=lambda x: self.manager.switch_to_screen('executive_function'))
-        
-        layout.add_widget(todo_list_btn)
-        layout.add_widget(times_deps_btn)
-        layout.add_widget(timeline_btn)
-        layout.add_widget(back_btn)
+        layout.add_widget(BackButton(self, 'executive_function'))
         
         self.add_widget(layout)
         
     def get_navigation_options(self):
         """Return the navigation options available from this screen."""
-        return [
-            'todo_list',
-            'times_dependencies',
-            'timeline_view'
-        ]
+        return _TODO_TIMELINE_OPTIONS
 
 
-class ToDoListScreen(Screen):
+class ToDoListScreen(LazyScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.name = 'todo_list'
-        
-        # Set screen background color
-        set_screen_background(self)
-        
+    
+    def _build(self):
         layout = BoxLayout(orientation='vertical', padding=20, spacing=15)
         
         # Title
@@ -249,18 +230,12 @@ class ToDoListScreen(Screen):
             size_hint_y=None,
             height=60,
             font_size=28,
-            color=ColorPalette.TEXT_PRIMARY
+            color=_TXT_P
         )
         layout.add_widget(title)
         
         # Instruction
-        instruction = Label(
-            text='write your to do list.',
-            size_hint_y=None,
-            height=30,
-            font_size=16,
-            color=ColorPalette.TEXT_SECONDARY
-        )
+        instruction = Label(text='write your to do list.', **_SUBTITLE_STYLE)
         layout.add_widget(instruction)
         
         # Text input area
@@ -268,7 +243,7 @@ class ToDoListScreen(Screen):
             hint_text='<Text Input>',
             multiline=True,
             font_size=16,
-            background_color=ColorPalette.BUTTON_SECONDARY
+            background_color=_BTN_S
         )
         layout.add_widget(self.text_input)
         
@@ -279,17 +254,11 @@ class ToDoListScreen(Screen):
             text='Groom my list',
             size_hint_y=None,
             height=50,
-            background_color=ColorPalette.BUTTON_SECONDARY
+            background_color=_BTN_S
         )
         groom_btn.bind(on_press=self.groom_list)
         
-        next_btn = Button(
-            text='Next',
-            size_hint_y=None,
-            height=50,
-            background_color=ColorPalette.BUTTON_TERTIARY
-        )
-        next_btn.bind(on_press=lambda x: self.manager.switch_to_screen('times_dependencies'))
+        next_btn = _nav_button(self, 'Next', 'times_dependencies', _BTN_T, 'SmallNavButton')
         
         button_layout.add_widget(groom_btn)
         button_layout.add_widget(next_btn)
@@ -297,36 +266,25 @@ class ToDoListScreen(Screen):
         layout.add_widget(button_layout)
         
         # Back button
-        back_btn = Button(
-            text='Back',
-            size_hint_y=None,
-            height=50,
-            background_color=ColorPalette.BUTTON_NEUTRAL
-        )
-        back_btn.bind(on_press=lambda x: self.manager.switch_to_screen('todo_timeline'))
+        back_btn = BackButton(self, 'todo_timeline')
         layout.add_widget(back_btn)
         
         self.add_widget(layout)
     
     def groom_list(self, button):
         # Placeholder for list grooming functionality
-        if self.text_input.text.strip():
-            items = self.text_input.text.strip().split('\n')
-            groomed_items = []
-            for i, item in enumerate(items, 1):
-                if item.strip():
-                    groomed_items.append(f"{i}. {item.strip()}")
-            self.text_input.text = '\n'.join(groomed_items)
+        items = [item for item in (line.strip() for line in self.text_input.text.splitlines()) if item]
+        if not items:
+            return
+        self.text_input.text = '\n'.join(f"{i}. {item}" for i, item in enumerate(items, 1))
 
 
-class TimesDependenciesScreen(Screen):
+class TimesDependenciesScreen(LazyScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.name = 'times_dependencies'
-        
-        # Set screen background color
-        set_screen_background(self)
-        
+    
+    def _build(self):
         layout = BoxLayout(orientation='vertical', padding=20, spacing=15)
         
         # Title
@@ -335,73 +293,30 @@ class TimesDependenciesScreen(Screen):
             size_hint_y=None,
             height=80,
             font_size=24,
-            color=ColorPalette.TEXT_PRIMARY
+            color=_TXT_P
         )
         layout.add_widget(title)
         
         # Subtitle
-        subtitle = Label(
-            text='Establish ToDos',
-            size_hint_y=None,
-            height=30,
-            font_size=16,
-            color=ColorPalette.TEXT_SECONDARY
-        )
+        subtitle = Label(text='Establish ToDos', **_SUBTITLE_STYLE)
         layout.add_widget(subtitle)
         
-        # Scrollable content
-        scroll = ScrollView()
-        content = BoxLayout(orientation='vertical', spacing=10, size_hint_y=None)
-        content.bind(minimum_height=content.setter('height'))
+        # Scrollable content; only the visible rows get widgets
+        rows = RecycleView()
+        rows_layout = RecycleBoxLayout(
+            orientation='vertical',
+            spacing=10,
+            size_hint_y=None,
+            default_size=(None, 120),
+            default_size_hint=(1, None)
+        )
+        rows_layout.bind(minimum_height=rows_layout.setter('height'))
+        rows.add_widget(rows_layout)
+        rows.viewclass = 'TodoItemRow'
         
         # Sample todo items
-        for i in range(1, 4):
-            item_layout = BoxLayout(
-                orientation='vertical', 
-                size_hint_y=None, 
-                height=120,
-                padding=10,
-                spacing=5
-            )
-            
-            item_label = Label(
-                text=f'<To do item n+{i-1}>',
-                size_hint_y=None,
-                height=30,
-                font_size=14,
-                color=ColorPalette.TEXT_PRIMARY
-            )
-            
-            time_input = TextInput(
-                hint_text='Time: <input text>',
-                size_hint_y=None,
-                height=30,
-                font_size=14
-            )
-            
-            deps_input = TextInput(
-                hint_text='Dependencies: <input text>',
-                size_hint_y=None,
-                height=30,
-                font_size=14
-            )
-            
-            item_layout.add_widget(item_label)
-            item_layout.add_widget(time_input)
-            item_layout.add_widget(deps_input)
-            
-            # Add colored background
-            item_layout.canvas.before.clear()
-            from kivy.graphics import Color, Rectangle
-            with item_layout.canvas.before:
-                Color(*ColorPalette.BUTTON_SECONDARY)
-                item_layout.bg_rect = Rectangle(size=item_layout.size, pos=item_layout.pos)
-            
-            item_layout.bind(size=self.update_bg, pos=self.update_bg)
-            content.add_widget(item_layout)
-        
-        scroll.add_widget(content)
-        layout.add_widget(scroll)
+        rows.data = [{'index': i, 'time': '', 'deps': ''} for i in range(3)]
+        layout.add_widget(rows)
         
         # Buttons
         button_layout = BoxLayout(orientation='vertical', size_hint_y=None, height=120, spacing=10)
@@ -410,16 +325,10 @@ class TimesDependenciesScreen(Screen):
             text='Groom my list',
             size_hint_y=None,
             height=50,
-            background_color=ColorPalette.BUTTON_SECONDARY
+            background_color=_BTN_S
         )
         
-        next_btn = Button(
-            text='Next',
-            size_hint_y=None,
-            height=50,
-            background_color=ColorPalette.BUTTON_TERTIARY
-        )
-        next_btn.bind(on_press=lambda x: self.manager.switch_to_screen('timeline_view'))
+        next_btn = _nav_button(self, 'Next', 'timeline_view', _BTN_T, 'SmallNavButton')
         
         button_layout.add_widget(groom_btn)
         button_layout.add_widget(next_btn)
@@ -427,30 +336,18 @@ class TimesDependenciesScreen(Screen):
         layout.add_widget(button_layout)
         
         # Back button
-        back_btn = Button(
-            text='Back',
-            size_hint_y=None,
-            height=50,
-            background_color=ColorPalette.BUTTON_NEUTRAL
-        )
-        back_btn.bind(on_press=lambda x: self.manager.switch_to_screen('todo_list'))
+        back_btn = BackButton(self, 'todo_list')
         layout.add_widget(back_btn)
         
         self.add_widget(layout)
-    
-    def update_bg(self, instance, value):
-        instance.bg_rect.pos = instance.pos
-        instance.bg_rect.size = instance.size
 
 
-class TimelineViewScreen(Screen):
+class TimelineViewScreen(LazyScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.name = 'timeline_view'
-        
-        # Set screen background color
-        set_screen_background(self)
-        
+    
+    def _build(self):
         layout = BoxLayout(orientation='vertical', padding=20, spacing=15)
         
         # Title
@@ -459,7 +356,7 @@ class TimelineViewScreen(Screen):
             size_hint_y=None,
             height=60,
             font_size=28,
-            color=ColorPalette.TEXT_SECONDARY
+            color=_TXT_S
         )
         layout.add_widget(title)
         
@@ -471,9 +368,8 @@ class TimelineViewScreen(Screen):
         )
         
         # Red and gray sections
-        from kivy.graphics import Color, Rectangle
-        red_section = Label(text='<Start\ntime>', size_hint_x=0.3, font_size=10, color=ColorPalette.TEXT_PRIMARY)
-        gray_section = Label(text='<Finish\ntime>', size_hint_x=0.7, font_size=10, color=ColorPalette.TEXT_PRIMARY)
+        red_section = Label(text='<Start\ntime>', size_hint_x=0.3, font_size=10, color=_TXT_P)
+        gray_section = Label(text='<Finish\ntime>', size_hint_x=0.7, font_size=10, color=_TXT_P)
         
         timeline_bar.add_widget(red_section)
         timeline_bar.add_widget(gray_section)
@@ -493,12 +389,12 @@ class TimelineViewScreen(Screen):
             size_hint_x=None,
             width=80,
             font_size=18,
-            color=ColorPalette.TEXT_PRIMARY
+            color=_TXT_P
         )
         
         task_info = BoxLayout(orientation='vertical')
-        task_name = Label(text='<To do item n>', font_size=16, color=ColorPalette.TEXT_PRIMARY)
-        task_next = Label(text='Next: <Todo item m>', font_size=14, color=ColorPalette.TEXT_SECONDARY)
+        task_name = Label(text='<To do item n>', font_size=16, color=_TXT_P)
+        task_next = Label(text='Next: <Todo item m>', font_size=14, color=_TXT_S)
         task_info.add_widget(task_name)
         task_info.add_widget(task_next)
         
@@ -507,7 +403,7 @@ class TimelineViewScreen(Screen):
             size_hint_x=None,
             width=100,
             font_size=12,
-            color=ColorPalette.TEXT_SECONDARY
+            color=_TXT_S
         )
         
         current_task.add_widget(now_label)
@@ -521,7 +417,7 @@ class TimelineViewScreen(Screen):
             size_hint_y=None,
             height=30,
             font_size=16,
-            color=ColorPalette.TEXT_PRIMARY
+            color=_TXT_P
         )
         layout.add_widget(parallel_label)
         
@@ -534,9 +430,9 @@ class TimelineViewScreen(Screen):
                 padding=10
             )
             
-            task_label = Label(text=f'<To do item n+{i+1}>', font_size=14, color=ColorPalette.TEXT_PRIMARY)
-            time_label = Label(text='Time: <hh:mm>', font_size=12, color=ColorPalette.TEXT_SECONDARY)
-            deps_label = Label(text='Dependencies: <input text>', font_size=12, color=ColorPalette.TEXT_SECONDARY)
+            task_label = Label(text=f'<To do item n+{i+1}>', font_size=14, color=_TXT_P)
+            time_label = Label(text='Time: <hh:mm>', font_size=12, color=_TXT_S)
+            deps_label = Label(text='Dependencies: <input text>', font_size=12, color=_TXT_S)
             
             parallel_task.add_widget(task_label)
             parallel_task.add_widget(time_label)
@@ -554,54 +450,43 @@ class TimelineViewScreen(Screen):
             size_hint_y=None,
             height=40,
             font_size=20,
-            color=ColorPalette.TEXT_PRIMARY
+            color=_TXT_P
         )
         todo_section.add_widget(todo_title)
         
         todo_content = Label(
             text='<Ordered List of groomed\nToDos>',
-            color=ColorPalette.TEXT_SECONDARY
+            color=_TXT_S
         )
         todo_section.add_widget(todo_content)
         
         layout.add_widget(todo_section)
         
         # Home button
-        home_btn = Button(
-            text='Home',
-            size_hint_y=None,
-            height=50,
-            background_color=ColorPalette.BUTTON_TERTIARY
-        )
-        home_btn.bind(on_press=lambda x: self.manager.switch_to_screen('main_menu'))
+        home_btn = _nav_button(self, 'Home', 'main_menu', _BTN_T, 'SmallNavButton')
         layout.add_widget(home_btn)
         
         # Back button
-        back_btn = Button(
-            text='Back',
-            size_hint_y=None,
-            height=50,
-            background_color=ColorPalette.BUTTON_NEUTRAL
-        )
-        back_btn.bind(on_press=lambda x: self.manager.switch_to_screen('times_dependencies'))
+        back_btn = BackButton(self, 'times_dependencies')
         layout.add_widget(back_btn)
         
         self.add_widget(layout)
 
 
 # Placeholder screens
-class EmotionsManagementScreen(Screen):
-    def __init__(self, **kwargs):
+class PlaceholderScreen(LazyScreen):
+    """'Coming Soon' screen for a feature that is not implemented yet."""
+    
+    def __init__(self, title, back_to, **kwargs):
         super().__init__(**kwargs)
-        self.name = 'emotions_management'
-        
-        # Set screen background color
-        set_screen_background(self)
-        
+        self._title = title
+        self._back_to = back_to
+    
+    def _build(self):
         layout = BoxLayout(orientation='vertical', padding=20, spacing=20)
         
         title = Label(
-            text='Emotions Management',
+            text=self._title,
             size_hint_y=None,
             height=80,
             font_size=28
@@ -612,13 +497,7 @@ class EmotionsManagementScreen(Screen):
             font_size=20
         )
         
-        back_btn = Button(
-            text='Back',
-            size_hint_y=None,
-            height=50,
-            background_color=ColorPalette.BUTTON_NEUTRAL
-        )
-        back_btn.bind(on_press=lambda x: self.manager.switch_to_screen('main_menu'))
+        back_btn = BackButton(self, self._back_to)
         
         layout.add_widget(title)
         layout.add_widget(placeholder)
@@ -627,112 +506,25 @@ class EmotionsManagementScreen(Screen):
         self.add_widget(layout)
 
 
-class HabitsScreen(Screen):
+class EmotionsManagementScreen(PlaceholderScreen):
     def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+        super().__init__('Emotions Management', 'main_menu', **kwargs)
+        self.name = 'emotions_management'
+
+
+class HabitsScreen(PlaceholderScreen):
+    def __init__(self, **kwargs):
+        super().__init__('Habits', 'main_menu', **kwargs)
         self.name = 'habits'
-        
-        # Set screen background color
-        set_screen_background(self)
-        
-        layout = BoxLayout(orientation='vertical', padding=20, spacing=20)
-        
-        title = Label(
-            text='Habits',
-            size_hint_y=None,
-            height=80,
-            font_size=28
-        )
-        
-        placeholder = Label(
-            text='Coming Soon...',
-            font_size=20
-        )
-        
-        back_btn = Button(
-            text='Back',
-            size_hint_y=None,
-            height=50,
-            background_color=ColorPalette.BUTTON_NEUTRAL
-        )
-        back_btn.bind(on_press=lambda x: self.manager.switch_to_screen('main_menu'))
-        
-        layout.add_widget(title)
-        layout.add_widget(placeholder)
-        layout.add_widget(back_btn)
-        
-        self.add_widget(layout)
 
 
-class PomodoroScreen(Screen):
+class PomodoroScreen(PlaceholderScreen):
     def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+        super().__init__('Pomodoro', 'executive_function', **kwargs)
         self.name = 'pomodoro'
-        
-        # Set screen background color
-        set_screen_background(self)
-        
-        layout = BoxLayout(orientation='vertical', padding=20, spacing=20)
-        
-        title = Label(
-            text='Pomodoro',
-            size_hint_y=None,
-            height=80,
-            font_size=28
-        )
-        
-        placeholder = Label(
-            text='Coming Soon...',
-            font_size=20
-        )
-        
-        back_btn = Button(
-            text='Back',
-            size_hint_y=None,
-            height=50,
-            background_color=ColorPalette.BUTTON_NEUTRAL
-        )
-        back_btn.bind(on_press=lambda x: self.manager.switch_to_screen('executive_function'))
-        
-        layout.add_widget(title)
-        layout.add_widget(placeholder)
-        layout.add_widget(back_btn)
-        
-        self.add_widget(layout)
 
 
-class RoutinesScreen(Screen):
+class RoutinesScreen(PlaceholderScreen):
     def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+        super().__init__('Routines', 'executive_function', **kwargs)
         self.name = 'routines'
-        
-        # Set screen background color
-        set_screen_background(self)
-        
-        layout = BoxLayout(orientation='vertical', padding=20, spacing=20)
-        
-        title = Label(
-            text='Routines',
-            size_hint_y=None,
-            height=80,
-            font_size=28
-        )
-        
-        placeholder = Label(
-            text='Coming Soon...',
-            font_size=20
-        )
-        
-        back_btn = Button(
-            text='Back',
-            size_hint_y=None,
-            height=50,
-            background_color=ColorPalette.BUTTON_NEUTRAL
-        )
-        back_btn.bind(on_press=lambda x: self.manager.switch_to_screen('executive_function'))
-        
-        layout.add_widget(title)
-        layout.add_widget(placeholder)
-        layout.add_widget(back_btn)
-        
-        self.add_widget(layout)
\ No newline at end of file
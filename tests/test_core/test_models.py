@@ -18,7 +18,7 @@ class TestTask:
         assert task.title == "Test Task"
         assert task.description == "Test description"
         assert task.estimated_time == 30
-        assert task.dependencies == []
+        assert task.dependencies == set()
         assert task.completed is False
         assert task.start_time is None
         assert task.end_time is None
@@ -49,6 +49,21 @@ class TestTask:
         
         assert len(sample_task.dependencies) == 1
     
+    def test_add_dependency_rejects_cycles(self, sample_task):
+        """Test that dependencies creating a cycle are rejected."""
+        middle = Task("Middle")
+        last = Task("Last")
+        middle.add_dependency(sample_task)
+        last.add_dependency(middle)
+        
+        with pytest.raises(ValueError):
+            sample_task.add_dependency(last)
+        with pytest.raises(ValueError):
+            sample_task.add_dependency(sample_task)
+        
+        assert sample_task.dependencies == set()
+        assert sample_task.can_start() is True
+    
     def test_remove_dependency(self, sample_task):
         """Test removing dependencies from a task."""
         dependency = Task("Dependency")
@@ -94,7 +109,46 @@ class TestTask:
         sample_task.add_dependency(dep2)
         
         assert sample_task.can_start() is False
-    
+
+    def test_can_start_after_dependency_completed_later(self, sample_task):
+        """Test can_start follows dependencies completed after being added."""
+        dependency = Task("Dependency")
+        sample_task.add_dependency(dependency)
+
+        dependency.mark_completed()
+        dependency.mark_completed()  # Completing twice must not count twice
+
+        assert sample_task.can_start() is True
+
+        other = Task("Other dependency")
+        sample_task.add_dependency(other)
+        assert sample_task.can_start() is False
+
+    def test_can_start_after_removing_dependencies(self, sample_task):
+        """Test removing completed or pending dependencies keeps can_start accurate."""
+        done = Task("Done dependency")
+        pending = Task("Pending dependency")
+        done.mark_completed()
+
+        sample_task.add_dependency(done)
+        sample_task.add_dependency(pending)
+        sample_task.remove_dependency(done)
+        assert sample_task.can_start() is False
+
+        sample_task.remove_dependency(pending)
+        assert sample_task.can_start() is True
+
+    def test_completed_is_read_only(self, sample_task):
+        """Test completion can only be set through mark_completed."""
+        dependent = Task("Dependent")
+        dependent.add_dependency(sample_task)
+        
+        with pytest.raises(AttributeError):
+            sample_task.completed = True
+        
+        assert sample_task.completed is False
+        assert dependent.can_start() is False
+
     @patch('src.core.models.datetime')
     def test_mark_completed(self, mock_datetime, sample_task):
         """Test marking a task as completed."""
@@ -143,7 +197,7 @@ class TestTaskManager:
     
     def test_task_manager_creation(self, task_manager):
         """Test TaskManager creation."""
-        assert task_manager.tasks == []
+        assert list(task_manager.tasks) == []
         assert task_manager.current_task is None
     
     def test_add_task(self, task_manager, sample_task):
@@ -153,6 +207,32 @@ class TestTaskManager:
         assert sample_task in task_manager.tasks
         assert len(task_manager.tasks) == 1
     
+    def test_tasks_is_a_live_read_only_view(self, task_manager, sample_task):
+        """Test tasks reflects later changes and cannot be modified directly."""
+        tasks = task_manager.tasks
+        task_manager.add_task(sample_task)
+        
+        assert list(tasks) == [sample_task]
+        assert not hasattr(tasks, 'append')
+    
+    def test_add_task_owned_by_another_manager(self, task_manager, sample_task):
+        """Test a task cannot be tracked by two managers at once."""
+        other_manager = TaskManager()
+        task_manager.add_task(sample_task)
+        
+        with pytest.raises(ValueError):
+            other_manager.add_task(sample_task)
+        
+        sample_task.mark_completed()
+        assert task_manager.get_ready_tasks() == []
+        assert task_manager.get_completed_count() == 1
+        assert list(other_manager.tasks) == []
+        
+        # Once removed from the first manager it can move to another
+        task_manager.remove_task(sample_task)
+        other_manager.add_task(sample_task)
+        assert other_manager.get_completed_tasks() == [sample_task]
+    
     def test_remove_task(self, task_manager, sample_task):
         """Test removing a task from the manager."""
         task_manager.add_task(sample_task)
@@ -200,7 +280,34 @@ class TestTaskManager:
         # Now task3 should be ready
         assert len(ready_tasks) == 1
         assert ready_tasks[0].title == "Task 3"
-    
+
+    def test_get_ready_tasks_tracks_changes_after_adding(self, task_manager):
+        """Test ready tasks follow dependency changes made after tasks are added."""
+        blocker = Task("Blocker")
+        first = Task("First")
+        second = Task("Second")
+        for task in (blocker, first, second):
+            task_manager.add_task(task)
+
+        first.add_dependency(blocker)
+        assert task_manager.get_ready_tasks() == [blocker, second]
+
+        # Unblocked tasks keep the order they were added in
+        blocker.mark_completed()
+        assert task_manager.get_ready_tasks() == [first, second]
+
+    def test_get_ready_tasks_after_removing_blocker(self, task_manager):
+        """Test removing a blocking task frees its dependents."""
+        blocker = Task("Blocker")
+        dependent = Task("Dependent")
+        dependent.add_dependency(blocker)
+        task_manager.add_task(blocker)
+        task_manager.add_task(dependent)
+
+        task_manager.remove_task(blocker)
+
+        assert task_manager.get_ready_tasks() == [dependent]
+
     def test_get_completed_tasks(self, populated_task_manager):
         """Test getting completed tasks."""
         task1 = next(task for task in populated_task_manager.tasks if task.title == "Task 1")
@@ -221,6 +328,35 @@ class TestTaskManager:
         assert len(pending_tasks) == 2
         assert all(not task.completed for task in pending_tasks)
     
+    def test_iter_completed_and_pending(self, populated_task_manager):
+        """Test the lazy variants yield the same tasks as the list versions."""
+        task1 = next(task for task in populated_task_manager.tasks if task.title == "Task 1")
+        task1.mark_completed()
+        
+        assert list(populated_task_manager.iter_completed()) == [task1]
+        assert list(populated_task_manager.iter_pending()) == populated_task_manager.get_pending_tasks()
+    
+    def test_completed_and_pending_counts(self, task_manager):
+        """Test counts follow completions, additions and removals."""
+        done = Task("Done")
+        done.mark_completed()
+        pending = Task("Pending")
+        task_manager.add_task(done)
+        task_manager.add_task(pending)
+        task_manager.add_task(pending)  # Adding twice must not count twice
+        
+        assert task_manager.get_completed_count() == 1
+        assert task_manager.get_pending_count() == 1
+        
+        pending.mark_completed()
+        pending.mark_completed()
+        assert task_manager.get_completed_count() == 2
+        assert task_manager.get_pending_count() == 0
+        
+        task_manager.remove_task(done)
+        assert task_manager.get_completed_count() == 1
+        assert task_manager.get_pending_count() == 0
+    
     def test_start_task_success(self, task_manager, sample_task):
         """Test starting a task successfully."""
         task_manager.add_task(sample_task)
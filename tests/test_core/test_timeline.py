@@ -172,4 +172,41 @@ class TestTimelineGeneration:
         task3.mark_completed()
         timeline_data = task_manager.get_timeline_data()
         assert len(timeline_data['ready_tasks']) == 1
-        assert timeline_data['ready_tasks'][0] == task4
\ No newline at end of file
+        assert timeline_data['ready_tasks'][0] == task4
+    
+    def test_timeline_upcoming_tasks_follow_dependency_order(self, task_manager):
+        """Test blocked tasks are listed as upcoming in the order they unlock."""
+        # Added out of order on purpose: deploy -> review -> write
+        deploy = Task("Deploy")
+        review = Task("Review")
+        write = Task("Write")
+        deploy.add_dependency(review)
+        review.add_dependency(write)
+        
+        for task in [deploy, review, write]:
+            task_manager.add_task(task)
+        
+        timeline_data = task_manager.get_timeline_data()
+        assert timeline_data['ready_tasks'] == [write]
+        assert timeline_data['upcoming_tasks'] == [review, deploy]
+        
+        # Completing a task moves the next one out of upcoming
+        write.mark_completed()
+        timeline_data = task_manager.get_timeline_data()
+        assert timeline_data['ready_tasks'] == [review]
+        assert timeline_data['upcoming_tasks'] == [deploy]
+    
+    def test_timeline_upcoming_tasks_after_dependency_changes(self, task_manager):
+        """Test upcoming tasks reflect dependencies added after tasks are managed."""
+        first = Task("First")
+        second = Task("Second")
+        task_manager.add_task(first)
+        task_manager.add_task(second)
+        
+        assert task_manager.get_timeline_data()['upcoming_tasks'] == []
+        
+        first.add_dependency(second)
+        timeline_data = task_manager.get_timeline_data()
+        
+        assert timeline_data['ready_tasks'] == [second]
+        assert timeline_data['upcoming_tasks'] == [first]
@@ -92,7 +92,34 @@ class TestTodoWorkflowLogic:
         
         # Now dependent task can start
         assert task2.can_start()
-        
+
+    def test_todo_workflow_rejects_unknown_task_ids(self):
+        """Test lookups with IDs that were never issued return None."""
+        from src.business.workflows import TodoWorkflow
+
+        workflow = TodoWorkflow()
+        task_id = workflow.add_task("Only task", "The single task", 10)
+
+        assert workflow.get_task(task_id).title == "Only task"
+        for unknown_id in (0, -1, task_id + 1, None, '1', True):
+            assert workflow.get_task(unknown_id) is None
+        assert workflow.set_dependency(task_id, depends_on=0) is False
+        assert workflow.set_dependency(task_id, depends_on=None) is False
+        assert workflow.start_task(-1) is False
+        assert workflow.complete_task(task_id + 1) is False
+
+    def test_todo_workflow_rejects_circular_dependencies(self):
+        """Test workflow refuses dependencies that would form a cycle."""
+        from src.business.workflows import TodoWorkflow
+
+        workflow = TodoWorkflow()
+        task1_id = workflow.add_task("First", "Comes first", 10)
+        task2_id = workflow.add_task("Second", "Needs first", 10)
+
+        assert workflow.set_dependency(task2_id, depends_on=task1_id) is True
+        assert workflow.set_dependency(task1_id, depends_on=task2_id) is False
+        assert workflow.get_task(task1_id).can_start()
+
     def test_todo_workflow_generates_timeline(self):
         """Test workflow generates timeline data correctly."""
         from src.business.workflows import TodoWorkflow
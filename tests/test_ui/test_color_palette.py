@@ -0,0 +1,19 @@
+"""
+Tests for the centralized color palette.
+"""
+from src.ui.color_palette import ColorPalette
+
+
+class TestColorPalette:
+    """Test cases for ColorPalette lookups."""
+    
+    def test_get_color_by_name(self):
+        """Test colors can be looked up by name regardless of case."""
+        assert ColorPalette.get_color('BUTTON_PRIMARY') == ColorPalette.BUTTON_PRIMARY
+        assert ColorPalette.get_color('text_secondary') == ColorPalette.TEXT_SECONDARY
+        assert ColorPalette.get_color('Legacy_Blue_Button') == ColorPalette.BUTTON_TERTIARY
+    
+    def test_get_color_unknown_name_falls_back(self):
+        """Test unknown or non-color names return the default background."""
+        assert ColorPalette.get_color('not_a_color') == ColorPalette.BACKGROUND_PRIMARY
+        assert ColorPalette.get_color('get_color') == ColorPalette.BACKGROUND_PRIMARY
\ No newline at end of file
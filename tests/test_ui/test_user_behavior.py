@@ -6,8 +6,8 @@ They test WHAT users can do, not HOW the UI is implemented.
 import pytest
 from src.business.navigation import ScreenNavigator
 from src.business.workflows import TodoWorkflow
-from src.ui.screens import MainMenuScreen, ExecutiveFunctionScreen, ToDoTimelineScreen
-from src.core.app import PersonalAssistantApp
+from src.ui.screens import MainMenuScreen, ExecutiveFunctionScreen, ToDoTimelineScreen, ToDoListScreen
+from src.core.app import PersonalAssistantApp, AppScreenManager
 
 
 class TestUserCanNavigate:
@@ -238,6 +238,121 @@ class TestUserInterfaceConfiguration:
         assert hasattr(app, 'title'), "App should have title"
         assert isinstance(app.title, str), "App title should be string"
         assert app.title.strip(), "App title should not be empty"
+        
+    def test_user_can_groom_todo_list(self):
+        """Test grooming numbers the non-empty lines of the user's list."""
+        screen = ToDoListScreen()
+        screen.dispatch('on_pre_enter')
+        screen.text_input.text = "  buy milk \n\n call mom\n"
+        
+        screen.groom_list(None)
+        
+        assert screen.text_input.text == "1. buy milk\n2. call mom"
+        
+        # An empty list is left untouched
+        screen.text_input.text = "   "
+        screen.groom_list(None)
+        assert screen.text_input.text == "   "
+
+    def test_typed_times_survive_row_recycling(self):
+        """Test what the user types into a todo row is kept when the row is reused."""
+        from kivy.clock import Clock
+        from kivy.uix.recycleview import RecycleView
+        from kivy.uix.textinput import TextInput
+        from src.ui.screens import TimesDependenciesScreen, TodoItemRow
+
+        screen = TimesDependenciesScreen()
+        screen.dispatch('on_pre_enter')
+        rows = next(w for w in screen.walk() if isinstance(w, RecycleView))
+        rows.size = (400, 800)
+        Clock.tick()
+        row = next(w for w in rows.walk() if isinstance(w, TodoItemRow))
+        time_input, deps_input = [w for w in row.walk() if isinstance(w, TextInput)]
+
+        time_input.text = '2h'
+        deps_input.text = '1'
+        assert rows.data[0]['time'] == '2h'
+        assert rows.data[0]['deps'] == '1'
+
+        # The view is handed another item, then scrolled back to the first one
+        row.refresh_view_attrs(rows, 1, rows.data[1])
+        assert time_input.text == ''
+        row.refresh_view_attrs(rows, 0, rows.data[0])
+        assert time_input.text == '2h'
+        assert deps_input.text == '1'
+
+    def test_screens_are_built_when_user_first_visits_them(self):
+        """Test only the main menu exists at startup and other screens appear on demand."""
+        manager = AppScreenManager()
+        
+        assert manager.current == 'main_menu'
+        assert manager.screen_names == ['main_menu']
+        
+        # User opens the todo list, then returns to the menu
+        manager.switch_to_screen('todo_list')
+        assert manager.current == 'todo_list'
+        
+        manager.switch_to_screen('main_menu')
+        assert manager.current == 'main_menu'
+        assert manager.screen_names == ['main_menu', 'todo_list'], "Revisits should reuse built screens"
+        
+    def test_remaining_screens_are_preloaded_after_startup(self):
+        """Test the other screens are built and added one per frame."""
+        from kivy.clock import Clock
+        
+        manager = AppScreenManager()
+        Clock.tick()
+        assert len(manager.screen_names) == 2, "Only one screen should be added per frame"
+        
+        for _ in range(10):
+            Clock.tick()
+        
+        assert len(manager.screen_names) == 10
+        assert manager.current == 'main_menu'
+        assert len(manager.get_screen('habits').children) == 1
+
+    def test_menu_buttons_take_user_to_their_screens(self):
+        """Test pressing a menu button or Back switches to the expected screen."""
+        from kivy.uix.button import Button
+        
+        manager = AppScreenManager()
+        manager.switch_to_screen('executive_function')
+        buttons = {
+            button.text: button
+            for button in manager.current_screen.walk(restrict=True)
+            if isinstance(button, Button)
+        }
+        
+        buttons['Pomodoro'].dispatch('on_press')
+        assert manager.current == 'pomodoro'
+        
+        manager.switch_to_screen('executive_function')
+        buttons['Back'].dispatch('on_press')
+        assert manager.current == 'main_menu'
+
+    def test_screens_can_be_added_to_a_plain_screen_manager(self):
+        """Test screens do not require AppScreenManager just to be added."""
+        from kivy.uix.screenmanager import ScreenManager
+
+        manager = ScreenManager()
+        manager.add_widget(MainMenuScreen(name='main_menu'))
+        assert manager.current == 'main_menu'
+
+    def test_placeholder_screens_fill_in_on_first_visit(self):
+        """Test a placeholder screen is not built until it is first entered, and only once."""
+        from src.ui.screens import HabitsScreen
+        
+        assert HabitsScreen().children == []
+        
+        manager = AppScreenManager()
+        manager.switch_to_screen('habits')
+        habits = manager.get_screen('habits')
+        assert len(habits.children) == 1
+        
+        # Coming back does not build a second copy
+        manager.switch_to_screen('main_menu')
+        manager.switch_to_screen('habits')
+        assert len(habits.children) == 1
 
 
 class TestCompleteUserScenarios: